@@ -0,0 +1,5 @@
+"""Shared Space Exploration RAG chatbot used by the Groq and Ollama launchers
+
+The chatbot itself lives in space_chatbot.core; it is not imported here so the
+lightweight helpers in space_chatbot.caching load without the ML stack.
+"""
@@ -0,0 +1,143 @@
+"""
+Caching and request batching helpers for the Space Exploration Chatbot
+"""
+import asyncio
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, List
+import numpy as np
+
+if TYPE_CHECKING:
+    from langchain_core.embeddings import Embeddings
+
+
+class ResponseCache:
+    """Semantic response cache that also matches paraphrased questions"""
+    
+    def __init__(self, embeddings: "Embeddings", max_size: int = 50, dim: int = 384, threshold: float = 0.95):
+        self.embeddings = embeddings
+        self.max_size = max_size
+        self.threshold = threshold
+        # Fixed-size ring buffer; the oldest slot is overwritten when full
+        self.vecs = np.empty((max_size, dim), dtype=np.float32)
+        self.answers: list[str | None] = [None] * max_size
+        self.count = 0
+        self.head = 0
+        # get() runs in worker threads while set()/clear() may run elsewhere
+        self.lock = threading.Lock()
+    
+    def _embed(self, query: str) -> np.ndarray:
+        # Same normalization as the retrieval key, so the vector can be reused there
+        vec = np.asarray(self.embeddings.embed_query(query.lower().strip()), dtype=np.float32)
+        return vec / np.linalg.norm(vec)
+    
+    def get(self, query: str) -> tuple[str | None, np.ndarray]:
+        """Return the cached answer (or None) and the query vector for set()"""
+        vec = self._embed(query)
+        with self.lock:
+            if not self.count:
+                return None, vec
+            sims = self.vecs[:self.count] @ vec
+            i = int(sims.argmax())
+            return (self.answers[i] if sims[i] >= self.threshold else None), vec
+    
+    def set(self, vec: np.ndarray, response: str) -> None:
+        with self.lock:
+            idx = self.head % self.max_size
+            self.vecs[idx] = vec
+            self.answers[idx] = response
+            self.head += 1
+            self.count = min(self.count + 1, self.max_size)
+    
+    def clear(self) -> None:
+        with self.lock:
+            self.answers = [None] * self.max_size
+            self.count = 0
+            self.head = 0
+
+
+class ContextCache:
+    """Thread-safe LRU cache of retrieved context keyed on the normalized query"""
+    
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self.cache: OrderedDict[str, str] = OrderedDict()
+        self.lock = threading.Lock()
+    
+    def get_many(self, queries: List[str], fetch: Callable[[List[str]], List[str]]) -> List[str]:
+        """Return context for each query, fetching all misses in one call"""
+        unique = list(dict.fromkeys(queries))
+        
+        # Capture hits before inserting anything so eviction cannot drop them
+        results: dict[str, str] = {}
+        with self.lock:
+            for query in unique:
+                if query in self.cache:
+                    self.cache.move_to_end(query)
+                    results[query] = self.cache[query]
+        
+        missing = [query for query in unique if query not in results]
+        if missing:
+            results.update(zip(missing, fetch(missing)))
+            with self.lock:
+                for query in missing:
+                    self.cache[query] = results[query]
+                    self.cache.move_to_end(query)
+                while len(self.cache) > self.max_size:
+                    self.cache.popitem(last=False)
+        
+        return [results[query] for query in queries]
+    
+    def clear(self) -> None:
+        with self.lock:
+            self.cache.clear()
+
+
+class QueryBatcher:
+    """Coalesces requests arriving within a short window into one batch call"""
+    
+    def __init__(self, batch_fn: Callable[[List[Any]], List[Any]], window: float = 0.02, max_batch: int = 16):
+        self.batch_fn = batch_fn
+        self.window = window
+        self.max_batch = max_batch
+        self.queue: asyncio.Queue | None = None
+        self.worker: asyncio.Task | None = None
+    
+    async def submit(self, request: Any) -> Any:
+        # Queue and worker are bound to the event loop serving requests
+        if self.worker is None:
+            self.queue = asyncio.Queue()
+            self.worker = asyncio.create_task(self._run())
+        
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((request, future))
+        return await future
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.window
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                results = await asyncio.to_thread(self.batch_fn, [request for request, _ in batch])
+                if len(results) != len(batch):
+                    # A short result list would leave callers awaiting forever
+                    raise RuntimeError(f"Batch returned {len(results)} results for {len(batch)} requests")
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            
+            for (_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
@@ -0,0 +1,638 @@
+"""
+Space Exploration Chatbot
+
+RAG-based chatbot using LangChain with:
+- PDF document ingestion and chunking
+- Chroma vector database with INT8 BGE embeddings (ONNX Runtime / HuggingFace fallback)
+- Pluggable LLM backend: Groq (llama-3.1-8b-instant) or local Ollama (llama3)
+- LangSmith tracing for monitoring
+- Semantic response cache
+- Gradio web interface with chat history
+"""
+import os
+import sys
+import asyncio
+import json
+import shutil
+import time
+import hashlib
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from operator import itemgetter
+from pathlib import Path
+from typing import AsyncIterator, Callable, List, Literal
+import chromadb
+import numpy as np
+from dotenv import load_dotenv
+from langchain_community.document_loaders import PyMuPDFLoader
+from langchain_text_splitters import RecursiveCharacterTextSplitter
+from langchain_huggingface import HuggingFaceEmbeddings
+from langchain_community.embeddings import QuantizedBgeEmbeddings
+from langchain_core.runnables import RunnableLambda
+from langchain_core.output_parsers import StrOutputParser
+from langchain_core.embeddings import Embeddings
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
+import gradio as gr
+from langsmith import traceable
+from .caching import ContextCache, QueryBatcher, ResponseCache
+
+# Load environment variables
+load_dotenv()
+
+# Configurations
+PDF_FILE = os.getenv("PDF_FILE", "space_exploration.pdf")
+LANGSMITH_API_KEY = os.getenv("LANGSMITH_API_KEY")
+LANGSMITH_PROJECT = os.getenv("LANGSMITH_PROJECT")
+LANGSMITH_TRACING = os.getenv("LANGSMITH_TRACING", "true").lower() == "true"
+GROQ_API_KEY = os.getenv("GROQ_API_KEY")
+
+LLMBackend = Literal["groq", "ollama"]
+
+# Vector store persistence
+CHROMA_DIR = Path("./chroma_db")
+MANIFEST_FILE = CHROMA_DIR / "manifest.json"
+COLLECTION_NAME = "space_missions"
+CHUNK_SIZE = 800
+CHUNK_OVERLAP = 80
+
+# HNSW index sized for a single-PDF corpus (hundreds of chunks, k=4)
+HNSW_METADATA = {
+    "hnsw:space": "cosine",
+    "hnsw:M": 8,
+    "hnsw:construction_ef": 64,
+    "hnsw:search_ef": 32,
+}
+
+# Embedding models
+EMBEDDING_MODEL = "Intel/bge-small-en-v1.5-sts-int8-static-inc"
+FALLBACK_EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+BGE_QUERY_INSTRUCTION = "Represent this sentence for searching relevant passages: "
+ONNX_MODEL_DIR = Path("./minilm_onnx")
+
+# Retrieval and request handling
+RETRIEVAL_K = 4
+CONTEXT_CACHE_SIZE = 128
+BATCH_WINDOW_SECONDS = 0.02
+MAX_BATCH_SIZE = 16
+MAX_CONCURRENT_QUERIES = 16
+
+def setup_langsmith_tracing():
+    """Setup LangSmith tracing if API key is configured"""
+    if LANGSMITH_API_KEY and LANGSMITH_TRACING:
+        os.environ["LANGSMITH_TRACING"] = "true"
+        os.environ["LANGSMITH_PROJECT"] = LANGSMITH_PROJECT
+        os.environ["LANGSMITH_RUN_ID"] = str(uuid.uuid4())
+        print(f"LangSmith tracing enabled (Project: {LANGSMITH_PROJECT})")
+        return True
+    return False
+
+
+class InMemoryChatMessageHistory(BaseChatMessageHistory):
+    """In-memory chat message history for storing conversation"""
+    
+    def __init__(self):
+        self.messages: list[BaseMessage] = []
+    
+    def add_message(self, message: BaseMessage) -> None:
+        """Add a message to history"""
+        self.messages.append(message)
+    
+    def clear(self) -> None:
+        """Clear all messages"""
+        self.messages = []
+
+
+class LazyEmbeddings(Embeddings):
+    """Embeddings wrapper that defers loading the model until first use"""
+    
+    def __init__(self, factory: Callable[[], Embeddings]):
+        self.factory = factory
+    
+    @cached_property
+    def model(self) -> Embeddings:
+        return self.factory()
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.model.embed_documents(texts)
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self.model.embed_query(text)
+    
+    def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Embed several queries in one batched pass"""
+        # Mirror embed_query for models that prepend a query instruction (BGE)
+        instruction = getattr(self.model, "query_instruction", None) or ""
+        return self.model.embed_documents([instruction + text for text in texts])
+
+
+class OnnxEmbeddings(Embeddings):
+    """Sentence-transformer embeddings served by ONNX Runtime (mean pooling + L2 norm)"""
+    
+    def __init__(self, model_name: str, model_dir: Path, batch_size: int = 64, max_length: int = 256):
+        from optimum.onnxruntime import ORTModelForFeatureExtraction, ORTOptimizer
+        from optimum.onnxruntime.configuration import OptimizationConfig
+        from transformers import AutoTokenizer
+        
+        optimized_file = "model_optimized.onnx"
+        required_files = (optimized_file, "tokenizer_config.json")
+        if not all((model_dir / name).exists() for name in required_files):
+            # One-time export to ONNX with fused attention/layernorm graph.
+            # Build in a temp dir and rename so a failed export never leaves
+            # a half-written model directory behind
+            print(f"Exporting {model_name} to ONNX...")
+            tmp_dir = model_dir.with_name(model_dir.name + ".tmp")
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            model = ORTModelForFeatureExtraction.from_pretrained(model_name, export=True)
+            ORTOptimizer.from_pretrained(model).optimize(
+                save_dir=tmp_dir,
+                optimization_config=OptimizationConfig(optimization_level=2)
+            )
+            AutoTokenizer.from_pretrained(model_name).save_pretrained(tmp_dir)
+            shutil.rmtree(model_dir, ignore_errors=True)
+            tmp_dir.rename(model_dir)
+        
+        self.model = ORTModelForFeatureExtraction.from_pretrained(model_dir, file_name=optimized_file)
+        self.tokenizer = AutoTokenizer.from_pretrained(model_dir)
+        self.batch_size = batch_size
+        self.max_length = max_length
+    
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            inputs = self.tokenizer(
+                texts[start:start + self.batch_size],
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                return_tensors="np"
+            )
+            hidden = self.model(**inputs).last_hidden_state
+            mask = inputs["attention_mask"][..., np.newaxis].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            pooled /= np.linalg.norm(pooled, axis=1, keepdims=True)
+            vectors.extend(pooled.tolist())
+        return vectors
+    
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self._embed(texts)
+    
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed([text])[0]
+
+
+class SpaceExplorationChatbot:
+    """Space Exploration Chatbot with RAG pipeline using a Groq or local Ollama LLM"""
+    
+    def __init__(self, backend: LLMBackend = "groq"):
+        if backend not in ("groq", "ollama"):
+            raise ValueError(f"Unknown LLM backend: {backend}")
+        
+        self.backend = backend
+        self.pdf_path = PDF_FILE
+        self.message_history = InMemoryChatMessageHistory()
+        self.embeddings = LazyEmbeddings(self._create_embeddings)
+        self.response_cache = ResponseCache(self.embeddings)
+        self.chain = None
+        self.collection = None
+        self._context_cache = ContextCache(CONTEXT_CACHE_SIZE)
+        self._batcher = QueryBatcher(self._retrieve_contexts, BATCH_WINDOW_SECONDS, MAX_BATCH_SIZE)
+        self.tracing_enabled = setup_langsmith_tracing()
+        
+        print("Space Exploration Chatbot - Initializing")
+        print("-" * 60)
+        
+        try:
+            # LLM setup, the ITREX probe (a heavy torch/transformers import),
+            # PDF splitting and embedder loading are independent, so overlap
+            # them; with a valid store the embedder stays lazy
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                futures = [executor.submit(self._initialize_llm)]
+                executor.submit(self._select_embedding_model).result()
+                
+                fingerprint = self._compute_fingerprint()
+                cache_hit = self._load_manifest().get("fingerprint") == fingerprint
+                if not cache_hit:
+                    futures.append(executor.submit(self._load_and_split_pdf))
+                    futures.append(executor.submit(lambda: self.embeddings.model))
+                for future in futures:
+                    future.result()
+            
+            self._initialize_vector_store(fingerprint, cache_hit)
+            self._create_rag_chain()
+            
+            print("Chatbot initialized successfully!")
+            print("-" * 60 + "\n")
+        
+        except Exception as e:
+            print(f"Initialization failed: {e}")
+            print("-" * 60 + "\n")
+            raise
+    
+    @traceable(name="load_and_split_pdf")
+    def _load_and_split_pdf(self):
+        """Load PDF and split into chunks"""
+        print(f"Loading PDF: {self.pdf_path}")
+        
+        if not Path(self.pdf_path).exists():
+            raise FileNotFoundError(f"PDF not found: {self.pdf_path}")
+        
+        # Load PDF (MuPDF C bindings extract text much faster than pypdf)
+        loader = PyMuPDFLoader(self.pdf_path)
+        documents = loader.load()
+        print(f"Loaded {len(documents)} pages")
+        
+        # Split documents
+        splitter = RecursiveCharacterTextSplitter(
+            chunk_size=CHUNK_SIZE,
+            chunk_overlap=CHUNK_OVERLAP,
+            separators=["\n\n", "\n", ". ", " ", ""]
+        )
+        self.documents = splitter.split_documents(documents)
+        print(f"Split into {len(self.documents)} chunks")
+    
+    def _compute_fingerprint(self) -> str:
+        """Hash the PDF contents together with the loader, splitter, embedding and index settings"""
+        if not Path(self.pdf_path).exists():
+            raise FileNotFoundError(f"PDF not found: {self.pdf_path}")
+        
+        with open(self.pdf_path, "rb") as f:
+            pdf_bytes = f.read()
+        hnsw = json.dumps(HNSW_METADATA, sort_keys=True)
+        params = f"|{PyMuPDFLoader.__name__}|{CHUNK_SIZE}|{CHUNK_OVERLAP}|{self.embedding_model}|{hnsw}".encode()
+        return hashlib.md5(pdf_bytes + params).hexdigest()
+    
+    def _load_manifest(self) -> dict:
+        """Read the manifest describing the persisted vector store"""
+        if not MANIFEST_FILE.exists():
+            return {}
+        try:
+            return json.loads(MANIFEST_FILE.read_text())
+        except (OSError, json.JSONDecodeError):
+            return {}
+    
+    def _select_embedding_model(self) -> None:
+        """Prefer the INT8 BGE model, falling back to MiniLM without ITREX"""
+        try:
+            # Import for real: ITREX is often installed but broken against
+            # newer torch/transformers, which find_spec would not catch
+            import intel_extension_for_transformers.transformers  # noqa: F401
+            self.embedding_model = EMBEDDING_MODEL
+        except Exception as e:
+            print(f"intel-extension-for-transformers unavailable ({e}), using HuggingFace embeddings")
+            self.embedding_model = FALLBACK_EMBEDDING_MODEL
+    
+    def _create_embeddings(self) -> Embeddings:
+        """Load the selected embedding model"""
+        if self.embedding_model == EMBEDDING_MODEL:
+            embeddings = QuantizedBgeEmbeddings(
+                model_name=EMBEDDING_MODEL,
+                encode_kwargs={"normalize_embeddings": True},
+                query_instruction=BGE_QUERY_INSTRUCTION
+            )
+        else:
+            try:
+                embeddings = OnnxEmbeddings(
+                    model_name=f"sentence-transformers/{FALLBACK_EMBEDDING_MODEL}",
+                    model_dir=ONNX_MODEL_DIR
+                )
+                print("Embedding model running on ONNX Runtime")
+            except Exception as e:
+                # Missing optimum, failed export (e.g. no hub access) or ORT/onnx mismatch
+                print(f"ONNX Runtime embeddings unavailable ({e}), using PyTorch embeddings")
+                embeddings = HuggingFaceEmbeddings(
+                    model_name=FALLBACK_EMBEDDING_MODEL,
+                    model_kwargs={"device": "cpu"},
+                    encode_kwargs={"batch_size": 64}
+                )
+                self._compile_embeddings(embeddings)
+        
+        print(f"Embeddings ready ({self.embedding_model})")
+        return embeddings
+    
+    def _compile_embeddings(self, embeddings: HuggingFaceEmbeddings) -> None:
+        """Fuse the sentence-transformer graph with torch.compile (eager on failure)"""
+        # Last-resort path: only reached when the ONNX Runtime embedder cannot
+        # load, so torch is imported here rather than at startup
+        import torch
+        
+        transformer = embeddings._client[0]
+        eager_model = transformer.auto_model
+        try:
+            transformer.auto_model = torch.compile(eager_model, mode="reduce-overhead")
+            # First call triggers compilation, keep it out of the query path
+            embeddings.embed_query("warmup")
+            print("Embedding model compiled (torch.compile)")
+        except Exception as e:
+            transformer.auto_model = eager_model
+            print(f"torch.compile unavailable, using eager model: {e}")
+    
+    @traceable(name="initialize_vector_store")
+    def _initialize_vector_store(self, fingerprint: str, cache_hit: bool):
+        print("Initializing vector store (Chroma)...")
+        
+        if not cache_hit and CHROMA_DIR.exists():
+            # Stale store - rebuild from scratch
+            shutil.rmtree(CHROMA_DIR)
+        
+        client = chromadb.PersistentClient(path=str(CHROMA_DIR))
+        if cache_hit:
+            # PDF and splitter settings unchanged - reuse persisted embeddings
+            print("Loading persisted Chroma vector store...")
+        else:
+            # Embed all chunks in a single batched call
+            print("Creating Chroma vector store...")
+            texts = [doc.page_content for doc in self.documents]
+            vectors = self.embeddings.embed_documents(texts)
+            collection = client.get_or_create_collection(
+                COLLECTION_NAME,
+                metadata=HNSW_METADATA
+            )
+            collection.add(
+                ids=[f"c{i}" for i in range(len(texts))],
+                embeddings=vectors,
+                documents=texts,
+                metadatas=[doc.metadata for doc in self.documents]
+            )
+            MANIFEST_FILE.write_text(json.dumps({
+                "fingerprint": fingerprint,
+                "collection_name": COLLECTION_NAME,
+                "embedding_model": self.embedding_model,
+            }, indent=2))
+        
+        self.collection = client.get_collection(COLLECTION_NAME)
+        print("Vector store ready")
+    
+    def _retrieve_contexts(self, requests: List[tuple[str, np.ndarray | None]]) -> List[str]:
+        """Fetch formatted context for (normalized query, query vector) pairs, serving repeats from the LRU cache"""
+        # Vectors from the response cache lookup are reused, not re-embedded
+        vectors = {query: vec for query, vec in requests if vec is not None}
+        return self._context_cache.get_many(
+            [query for query, _ in requests],
+            lambda missing: self._fetch_contexts(missing, vectors)
+        )
+    
+    def _fetch_contexts(self, queries: List[str], vectors: dict[str, np.ndarray]) -> List[str]:
+        """Retrieve chunks for all queries with one Chroma query, embedding only those without a vector"""
+        unembedded = [query for query in queries if query not in vectors]
+        if unembedded:
+            vectors = {**vectors, **dict(zip(unembedded, self.embeddings.embed_queries(unembedded)))}
+        
+        # Plain top-k similarity; MMR diversity adds little for a single PDF
+        results = self.collection.query(
+            query_embeddings=[np.asarray(vectors[query], dtype=np.float32).tolist() for query in queries],
+            n_results=RETRIEVAL_K,
+            include=["documents"]
+        )
+        return ["\n".join(docs) for docs in results["documents"]]
+    
+    @traceable(name="initialize_llm")
+    def _initialize_llm(self):
+        if self.backend == "groq":
+            self._initialize_groq_llm()
+        else:
+            self._initialize_ollama_llm()
+    
+    def _initialize_groq_llm(self):
+        # Imported here so the Ollama setup does not need langchain-groq
+        from langchain_groq import ChatGroq
+        
+        print("Initializing LLM (Groq Cloud)...")
+        
+        if not GROQ_API_KEY:
+            raise ValueError(
+                "GROQ_API_KEY not found in environment variables."
+                "Get a free key at: https://console.groq.com"
+                "Set in .env: GROQ_API_KEY=gsk_xxxxx"
+            )
+        
+        self.llm = ChatGroq(
+            api_key=GROQ_API_KEY,
+            model="llama-3.1-8b-instant",
+            temperature=0.3,
+            max_retries=2,
+            streaming=True,
+        )
+        print("LLM initialized (llama-3.1-8b-instant)")
+    
+    def _initialize_ollama_llm(self):
+        from langchain_community.llms import Ollama
+        
+        print("Initializing LLM (Local Ollama - Offline Mode)...")
+        
+        try:
+            self.llm = Ollama(
+                model="llama3",
+                base_url="http://localhost:11434",
+                temperature=0.3,
+            )
+            print("LLM initialized (Ollama - llama3)")
+        except Exception as e:
+            raise ValueError(
+                "Ollama server not running. Please start it with: ollama serve"
+            ) from e
+    
+    @traceable(name="create_rag_chain")
+    def _create_rag_chain(self):
+        print("Creating RAG chain...")
+        
+        # Static prompt segments are built once; only context and question
+        # are filled in per query, skipping ChatPromptTemplate rendering
+        # Chat models get the text as a human message; completion models
+        # (Ollama) previously saw ChatPromptValue.to_string(), i.e. "Human: ..."
+        role_prefix = "Human: " if self.backend == "ollama" else ""
+        self._prompt_prefix = role_prefix + """You are SpaceBot, an expert guide to space exploration.
+
+You have context information about space missions and astronomy.
+IMPORTANT: Only use the context if it is relevant to the question.
+If the context is not helpful or relevant, simply answer the question based on your knowledge.
+Do not force irrelevant information into your response.
+
+Context (use only if relevant):
+"""
+        self._prompt_suffix = "\n\nAnswer:"
+        
+        def build_prompt(inputs: dict) -> str:
+            return f"{self._prompt_prefix}{inputs['context']}\n\nQuestion: {inputs['question']}{self._prompt_suffix}"
+        
+        # Repeated questions are served from the context cache, and concurrent
+        # ones share a single Chroma query. Input is {"question", "query_vec"},
+        # where query_vec is the response cache's embedding of the question
+        def retrieval_request(inputs: dict) -> tuple[str, np.ndarray | None]:
+            return inputs["question"].lower().strip(), inputs.get("query_vec")
+        
+        def retrieve_context(inputs: dict) -> str:
+            return self._retrieve_contexts([retrieval_request(inputs)])[0]
+        
+        async def aretrieve_context(inputs: dict) -> str:
+            return await self._batcher.submit(retrieval_request(inputs))
+        
+        # Build LCEL chain
+        self.chain = (
+            {
+                "context": RunnableLambda(retrieve_context, afunc=aretrieve_context),
+                "question": itemgetter("question")
+            }
+            | RunnableLambda(build_prompt)
+            | self.llm
+            | StrOutputParser()
+        )
+        print("RAG chain created")
+    
+    @traceable(name="space_chatbot_query")
+    async def achat(self, user_message: str) -> AsyncIterator[str]:
+        """Process user message and stream the response as it is generated"""
+        try:
+            # Check cache first; embedding runs off the event loop so other
+            # users' streams are not blocked (first call may also load the model).
+            # The query vector is reused for retrieval below
+            cached_response, query_vec = await asyncio.to_thread(self.response_cache.get, user_message)
+            if cached_response:
+                print(f"Using cached response (instant)")
+                self.message_history.add_message(HumanMessage(content=user_message))
+                self.message_history.add_message(AIMessage(content=cached_response))
+                yield cached_response
+                return
+            
+            # Process new query, yielding the accumulated text per token
+            start_time = time.time()
+            response = ""
+            async for chunk in self.chain.astream({"question": user_message, "query_vec": query_vec}):
+                response += chunk
+                yield response
+            elapsed = time.time() - start_time
+            
+            # Cache the response
+            self.response_cache.set(query_vec, response)
+            
+            # Store in history
+            self.message_history.add_message(HumanMessage(content=user_message))
+            self.message_history.add_message(AIMessage(content=response))
+            
+            print(f"Response time: {elapsed:.2f}s")
+        
+        except Exception as e:
+            error_msg = f"Error: {str(e)}"
+            print(f"Error during query: {error_msg}")
+            yield error_msg
+    
+    def get_history(self) -> str:
+        """Get formatted chat history"""
+        if not self.message_history.messages:
+            return "No conversation history yet."
+        
+        # Collect lines and join once instead of repeated string concatenation
+        parts = ["Chat History", "-" * 40, ""]
+        messages = self.message_history.messages
+        for i in range(0, len(messages) - 1, 2):
+            parts.append(f"Q{i // 2 + 1}: {messages[i].content}")
+            parts.append(f"A{i // 2 + 1}: {messages[i + 1].content}")
+            parts.append("")
+        return "\n".join(parts) + "\n"
+    
+    def clear_history(self):
+        """Clear chat history"""
+        self.message_history.clear()
+        self._context_cache.clear()
+        self.response_cache.clear()
+        return "Chat history and cache cleared."
+
+
+def create_gradio_interface(chatbot: SpaceExplorationChatbot):    
+    greeting = "Hello, I am SpaceBot, your guide to space exploration. Ask me about missions or astronomy!"
+    
+    async def process_query(user_input):
+        if not user_input.strip():
+            yield "", chatbot.get_history()
+            return
+        
+        # Stream partial responses; refresh history once the answer is complete
+        response = ""
+        async for response in chatbot.achat(user_input):
+            yield response, gr.update()
+        yield response, chatbot.get_history()
+    
+    def clear_chat():
+        chatbot.clear_history()
+        return "", "", chatbot.get_history()
+    
+    with gr.Blocks(
+        title="Space Exploration Chatbot",
+        theme=gr.themes.Soft()
+    ) as interface:
+        gr.Markdown("""
+        # Space Exploration Chatbot
+        ## Your Guide to Space Missions and Astronomy
+        """)
+        
+        gr.Markdown(f"*{greeting}*")
+        
+        with gr.Row():
+            with gr.Column():
+                user_input = gr.Textbox(
+                    label="Your Question",
+                    placeholder="Ask about Space Missions & Astronomy...",
+                    lines=3
+                )
+                submit_btn = gr.Button("Submit", variant="primary")
+                clear_btn = gr.Button("Clear History")
+            
+            with gr.Column():
+                response_output = gr.Textbox(
+                    label="Response",
+                    lines=6,
+                    interactive=False
+                )
+                history_output = gr.Textbox(
+                    label="Chat History",
+                    lines=8,
+                    interactive=False,
+                    value="No conversation history yet."
+                )
+        
+        # Connect buttons
+        submit_btn.click(
+            process_query,
+            inputs=[user_input],
+            outputs=[response_output, history_output]
+        ).then(lambda: "", outputs=user_input)
+        
+        clear_btn.click(
+            clear_chat,
+            inputs=[],
+            outputs=[user_input, response_output, history_output]
+        )
+    
+    # Serve users concurrently so their retrievals can be batched together
+    interface.queue(default_concurrency_limit=MAX_CONCURRENT_QUERIES)
+    return interface
+
+
+def main(backend: LLMBackend = "groq"):
+    try:
+        # Initialize chatbot
+        chatbot = SpaceExplorationChatbot(backend)
+        
+        # Create and launch Gradio interface
+        print("Launching Gradio interface...")
+        interface = create_gradio_interface(chatbot)
+        interface.launch(
+            server_name="127.0.0.1",
+            server_port=7860,
+            share=False,
+            show_error=True,
+            max_threads=MAX_CONCURRENT_QUERIES * 2,
+        )
+    
+    except KeyboardInterrupt:
+        print("Chatbot stopped by user")
+        sys.exit(0)
+    
+    except Exception as e:
+        print(f"Fatal error: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main(os.getenv("LLM_BACKEND", "groq"))
@@ -0,0 +1,198 @@
+"""Tests for the caching and batching helpers in space_chatbot.caching"""
+import asyncio
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from space_chatbot.caching import ContextCache, QueryBatcher, ResponseCache
+
+
+class FakeEmbeddings:
+    """Maps known texts to fixed vectors and counts embed calls"""
+
+    def __init__(self, vectors: dict[str, list[float]]):
+        self.vectors = vectors
+        self.calls = 0
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls += 1
+        return self.vectors[text]
+
+
+class RecordingFetch:
+    """Batch fetch function that records every call it receives"""
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def __call__(self, queries: list[str]) -> list[str]:
+        self.calls.append(list(queries))
+        return [f"ctx:{q}" for q in queries]
+
+
+# ContextCache
+
+def test_context_cache_fetches_only_misses_in_one_call():
+    cache = ContextCache(max_size=3)
+    fetch = RecordingFetch()
+
+    assert cache.get_many(["a", "b"], fetch) == ["ctx:a", "ctx:b"]
+    assert cache.get_many(["a", "c", "c"], fetch) == ["ctx:a", "ctx:c", "ctx:c"]
+    assert fetch.calls == [["a", "b"], ["c"]]
+
+
+def test_context_cache_refreshed_hit_survives_eviction():
+    cache = ContextCache(max_size=3)
+    fetch = RecordingFetch()
+    cache.get_many(["a", "b", "c"], fetch)
+
+    # The hit refreshes "a", so the miss evicts "b" (least recently used)
+    assert cache.get_many(["a", "d"], fetch) == ["ctx:a", "ctx:d"]
+    assert list(cache.cache) == ["c", "a", "d"]
+
+
+def test_context_cache_returns_hit_evicted_within_same_batch():
+    cache = ContextCache(max_size=2)
+    fetch = RecordingFetch()
+    cache.get_many(["a", "b"], fetch)
+
+    # Two misses overflow the cache and evict "a" even though it was just
+    # hit; the batch must still return it from the pre-insert snapshot
+    assert cache.get_many(["a", "c", "d"], fetch) == ["ctx:a", "ctx:c", "ctx:d"]
+    assert list(cache.cache) == ["c", "d"]
+    assert fetch.calls[-1] == ["c", "d"]
+
+
+def test_context_cache_is_lru():
+    cache = ContextCache(max_size=2)
+    fetch = RecordingFetch()
+    cache.get_many(["a", "b"], fetch)
+    cache.get_many(["a"], fetch)  # refresh "a"
+    cache.get_many(["c"], fetch)  # evicts "b", not "a"
+
+    assert list(cache.cache) == ["a", "c"]
+
+
+def test_context_cache_clear():
+    cache = ContextCache()
+    fetch = RecordingFetch()
+    cache.get_many(["a"], fetch)
+    cache.clear()
+    cache.get_many(["a"], fetch)
+
+    assert fetch.calls == [["a"], ["a"]]
+
+
+# ResponseCache
+
+def test_response_cache_hit_and_miss():
+    embeddings = FakeEmbeddings({
+        "what is apollo 11?": [1.0, 0.0],
+        "tell me about apollo 11": [0.99, 0.05],
+        "what is a pulsar?": [0.0, 1.0],
+    })
+    cache = ResponseCache(embeddings, max_size=4, dim=2)
+
+    answer, vec = cache.get("what is apollo 11?")
+    assert answer is None
+    cache.set(vec, "moon landing")
+
+    assert cache.get("tell me about apollo 11")[0] == "moon landing"
+    assert cache.get("what is a pulsar?")[0] is None
+
+
+def test_response_cache_set_reuses_lookup_vector():
+    embeddings = FakeEmbeddings({"q": [3.0, 4.0]})
+    cache = ResponseCache(embeddings, max_size=2, dim=2)
+
+    _, vec = cache.get("q")
+    cache.set(vec, "answer")
+
+    assert embeddings.calls == 1
+    np.testing.assert_allclose(cache.vecs[0], [0.6, 0.8])
+
+
+def test_response_cache_ring_buffer_overwrites_oldest():
+    embeddings = FakeEmbeddings({"a": [1.0, 0.0], "b": [0.0, 1.0], "c": [-1.0, 0.0]})
+    cache = ResponseCache(embeddings, max_size=2, dim=2)
+    for query in ["a", "b", "c"]:
+        cache.set(cache.get(query)[1], query.upper())
+
+    assert cache.count == 2
+    assert cache.get("a")[0] is None
+    assert cache.get("b")[0] == "B"
+    assert cache.get("c")[0] == "C"
+
+    cache.clear()
+    assert cache.get("b")[0] is None
+
+
+# QueryBatcher
+
+def test_query_batcher_coalesces_concurrent_queries():
+    fetch = RecordingFetch()
+
+    async def run():
+        batcher = QueryBatcher(fetch, window=0.05)
+        first = await asyncio.gather(*(batcher.submit(q) for q in ["a", "b", "c"]))
+        second = await batcher.submit("d")
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == ["ctx:a", "ctx:b", "ctx:c"]
+    assert second == "ctx:d"
+    assert fetch.calls == [["a", "b", "c"], ["d"]]
+
+
+def test_query_batcher_respects_max_batch():
+    fetch = RecordingFetch()
+
+    async def run():
+        batcher = QueryBatcher(fetch, window=0.05, max_batch=2)
+        return await asyncio.gather(*(batcher.submit(q) for q in ["a", "b", "c"]))
+
+    assert asyncio.run(run()) == ["ctx:a", "ctx:b", "ctx:c"]
+    assert fetch.calls == [["a", "b"], ["c"]]
+
+
+def test_query_batcher_with_context_cache_mixed_hits_and_misses():
+    cache = ContextCache(max_size=3)
+    fetch = RecordingFetch()
+    cache.get_many(["a", "b", "c"], fetch)
+
+    async def run():
+        batcher = QueryBatcher(lambda queries: cache.get_many(queries, fetch), window=0.05)
+        return await asyncio.gather(*(batcher.submit(q) for q in ["a", "d", "b", "e"]))
+
+    assert asyncio.run(run()) == ["ctx:a", "ctx:d", "ctx:b", "ctx:e"]
+    assert fetch.calls[-1] == ["d", "e"]
+
+
+def test_query_batcher_propagates_errors_to_batch():
+    def failing(queries):
+        raise RuntimeError("chroma down")
+
+    async def run():
+        batcher = QueryBatcher(failing, window=0.01)
+        return await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+def test_query_batcher_fails_all_futures_on_short_results():
+    async def run():
+        batcher = QueryBatcher(lambda queries: queries[:1], window=0.05)
+        return await asyncio.wait_for(
+            asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True),
+            timeout=1
+        )
+
+    results = asyncio.run(run())
+    assert all(isinstance(r, RuntimeError) for r in results)
+    with pytest.raises(RuntimeError, match="1 results for 2 requests"):
+        raise results[0]